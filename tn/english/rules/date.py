@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 import pynini
 from pynini.examples import plurals
 from pynini.lib import pynutil
@@ -22,20 +24,60 @@ from tn.utils import get_abs_path, load_labels, augment_labels_with_punct_at_end
 from tn.english.rules.cardinal import Cardinal
 from tn.english.rules.ordinal import Ordinal
 
-graph_teen = pynini.invert(
-    pynini.string_file(get_abs_path("english/data/number/teen.tsv"))
-).optimize()
-graph_digit = pynini.invert(
-    pynini.string_file(get_abs_path("english/data/number/digit.tsv"))
-).optimize()
-ties_graph = pynini.invert(
-    pynini.string_file(get_abs_path("english/data/number/ty.tsv"))
-).optimize()
-year_suffix = load_labels(get_abs_path("english/data/date/year_suffix.tsv"))
-year_suffix.extend(augment_labels_with_punct_at_end(year_suffix))
-year_suffix = pynini.string_map(year_suffix).optimize()
+# The helpers below are memoized, so every caller shares the returned fsts.
+# Never modify them in place (|=, +=, optimize), take a .copy() instead.
+
+
+# shared instance for the character classes used by the helpers below
+@lru_cache(maxsize=1)
+def _get_processor():
+    return Processor("tmp")
+
+
+@lru_cache(maxsize=1)
+def _get_number_graphs():
+    """
+    Returns the teen, digit and ties transducers, e.g.
+    13 -> thirteen, 3 -> three, 3 -> thirty
+    """
+    graph_teen = pynini.invert(
+        pynini.string_file(get_abs_path("english/data/number/teen.tsv"))
+    ).optimize()
+    graph_digit = pynini.invert(
+        pynini.string_file(get_abs_path("english/data/number/digit.tsv"))
+    ).optimize()
+    ties_graph = pynini.invert(
+        pynini.string_file(get_abs_path("english/data/number/ty.tsv"))
+    ).optimize()
+    return graph_teen, graph_digit, ties_graph
+
+
+@lru_cache(maxsize=1)
+def _get_year_suffix():
+    year_suffix = load_labels(get_abs_path("english/data/date/year_suffix.tsv"))
+    year_suffix.extend(augment_labels_with_punct_at_end(year_suffix))
+    return pynini.string_map(year_suffix).optimize()
+
 
+@lru_cache(maxsize=1)
+def _get_year_sigma():
+    processor = _get_processor()
+    # spelled-out years only contain lowercase letters and spaces, so the
+    # plural rewrites below do not need the whole VCHAR alphabet as sigma
+    return (processor.LOWER | " ").star.optimize()
 
+
+@lru_cache(maxsize=2)
+def _get_cardinal(deterministic: bool = False):
+    return Cardinal(deterministic)
+
+
+@lru_cache(maxsize=2)
+def _get_ordinal(deterministic: bool = False):
+    return Ordinal(deterministic)
+
+
+@lru_cache(maxsize=2)
 def get_ties_graph(deterministic: bool = False):
     """
     Returns two digit transducer, e.g.
@@ -43,28 +85,28 @@ def get_ties_graph(deterministic: bool = False):
     12 -> thirteen
     20 -> twenty
     """
+    processor = _get_processor()
+    graph_teen, graph_digit, ties_graph = _get_number_graphs()
     graph = (
         graph_teen
         | ties_graph + pynutil.delete("0")
-        | ties_graph + Processor("tmp").INSERT_SPACE + graph_digit
+        | ties_graph + processor.INSERT_SPACE + graph_digit
     )
 
     if deterministic:
-        graph = (
-            graph
-            | pynini.cross("0", "oh") + Processor("tmp").INSERT_SPACE + graph_digit
-        )
+        graph = graph | pynini.cross("0", "oh") + processor.INSERT_SPACE + graph_digit
     else:
         graph = (
             graph
             | (pynini.cross("0", "oh") | pynini.cross("0", "zero"))
-            + Processor("tmp").INSERT_SPACE
+            + processor.INSERT_SPACE
             + graph_digit
         )
 
     return graph.optimize()
 
 
+@lru_cache(maxsize=2)
 def get_four_digit_year_graph(deterministic: bool = False):
     """
     Returns a four digit transducer which is combination of ties/teen or digits
@@ -72,80 +114,84 @@ def get_four_digit_year_graph(deterministic: bool = False):
     1219 -> twelve nineteen
     3900 -> thirty nine hundred
     """
+    processor = _get_processor()
+    graph_teen, graph_digit, ties_graph = _get_number_graphs()
     graph_ties = get_ties_graph(deterministic)
 
     graph_with_s = (
-        (graph_ties + Processor("tmp").INSERT_SPACE + graph_ties)
+        (graph_ties + processor.INSERT_SPACE + graph_ties)
         | (
             graph_teen
-            + Processor("tmp").INSERT_SPACE
+            + processor.INSERT_SPACE
             + (ties_graph | pynini.cross("1", "ten"))
         )
     ) + pynutil.delete("0s")
 
     graph_with_s |= (
         (graph_teen | graph_ties)
-        + Processor("tmp").INSERT_SPACE
+        + processor.INSERT_SPACE
         + pynini.cross("00", "hundred")
         + pynutil.delete("s")
     )
-    graph_with_s = (
-        graph_with_s
-        @ pynini.cdrewrite(
-            pynini.cross("y", "ies") | pynutil.insert("s"),
-            "",
-            "[EOS]",
-            Processor("tmp").VCHAR,
-        ).star
+    graph_with_s = graph_with_s @ pynini.cdrewrite(
+        pynini.cross("y", "ies") | pynutil.insert("s"),
+        "",
+        "[EOS]",
+        _get_year_sigma(),
     )
 
-    graph = graph_ties + Processor("tmp").INSERT_SPACE + graph_ties
+    graph = graph_ties + processor.INSERT_SPACE + graph_ties
     graph |= (
         (graph_teen | graph_ties)
-        + Processor("tmp").INSERT_SPACE
+        + processor.INSERT_SPACE
         + pynini.cross("00", "hundred")
     )
 
     thousand_graph = (
         graph_digit
-        + Processor("tmp").INSERT_SPACE
+        + processor.INSERT_SPACE
         + pynini.cross("00", "thousand")
-        + (pynutil.delete("0") | Processor("tmp").INSERT_SPACE + graph_digit)
+        + (pynutil.delete("0") | processor.INSERT_SPACE + graph_digit)
     )
     thousand_graph |= (
         graph_digit
-        + Processor("tmp").INSERT_SPACE
+        + processor.INSERT_SPACE
         + pynini.cross("000", "thousand")
         + pynutil.delete(" ").ques
         + pynini.accep("s")
     )
 
+    # X000s is read by thousand_graph, e.g. 1000s -> one thousands, so keep
+    # graph_with_s from adding "ten hundreds" next to it
+    graph_with_s = (
+        (processor.DIGIT | "s").star
+        - pynini.project(thousand_graph, "input").optimize()
+    ) @ graph_with_s
     graph |= graph_with_s
     if deterministic:
-        graph = plurals._priority_union(
-            thousand_graph, graph, Processor("tmp").VCHAR.star
-        )
+        graph = plurals._priority_union(thousand_graph, graph, processor.VCHAR.star)
     else:
         graph |= thousand_graph
 
     return graph.optimize()
 
 
+@lru_cache(maxsize=1)
 def _get_two_digit_year_with_s_graph():
     # to handle '70s -> seventies
+    _, _, ties_graph = _get_number_graphs()
     graph = (
         pynutil.delete("'").ques
         + pynini.compose(
             ties_graph + pynutil.delete("0s"),
-            pynini.cdrewrite(
-                pynini.cross("y", "ies"), "", "[EOS]", Processor("tmp").VCHAR.star
-            ),
+            pynini.cdrewrite(pynini.cross("y", "ies"), "", "[EOS]", _get_year_sigma()),
         )
     ).optimize()
     return graph
 
 
-def _get_year_graph(cardinal_graph, deterministic: bool = False):
+@lru_cache(maxsize=2)
+def _get_year_graph(deterministic: bool = False):
     """
     Transducer for year, only from 1000 - 2999 e.g.
     1290 -> twelve nineteen
@@ -156,33 +202,37 @@ def _get_year_graph(cardinal_graph, deterministic: bool = False):
     Transducer for year with suffix
     123 A.D., 4200 B.C
     """
+    processor = _get_processor()
+    cardinal = _get_cardinal(deterministic)
+    cardinal_graph = cardinal.graph_hundred_component_at_least_one_none_zero_digit
     graph = get_four_digit_year_graph(deterministic)
     graph = (
         pynini.union("1", "2")
-        + (Processor("tmp").DIGIT ** 3)
+        + (processor.DIGIT**3)
         + (pynini.cross(" s", "s") | "s").ques
     ) @ graph
 
     graph |= _get_two_digit_year_with_s_graph()
 
     three_digit_year = (
-        (Processor("tmp").DIGIT @ cardinal_graph)
-        + Processor("tmp").INSERT_SPACE
-        + (Processor("tmp").DIGIT ** 2) @ cardinal_graph
+        (processor.DIGIT @ cardinal_graph)
+        + processor.INSERT_SPACE
+        + (processor.DIGIT**2) @ cardinal_graph
     )
     year_with_suffix = (
-        (get_four_digit_year_graph(deterministic=True) | three_digit_year)
-        + Processor("tmp").DELETE_SPACE
-        + Processor("tmp").INSERT_SPACE
-        + year_suffix
+        (get_four_digit_year_graph(True) | three_digit_year)
+        + processor.DELETE_SPACE
+        + processor.INSERT_SPACE
+        + _get_year_suffix()
     )
     graph |= year_with_suffix
     return graph.optimize()
 
 
 def _get_two_digit_year(cardinal_graph, single_digits_graph):
-    two_digit_year = Processor("tmp").DIGIT ** (2) @ plurals._priority_union(
-        cardinal_graph, single_digits_graph, Processor("tmp").VCHAR.star
+    processor = _get_processor()
+    two_digit_year = processor.DIGIT ** (2) @ plurals._priority_union(
+        cardinal_graph, single_digits_graph, processor.VCHAR.star
     )
     return two_digit_year
 
@@ -203,16 +253,47 @@ def _get_financial_period_graph():
 
 class Date(Processor):
 
-    def __init__(self, deterministic: bool = False):
+    def __init__(
+        self,
+        deterministic: bool = False,
+        cache_dir=None,
+        overwrite_cache: bool = False,
+    ):
         """
         Args:
             deterministic: if True will provide a single transduction option,
                 for False multiple transduction are generated (used for audio-based normalization)
+            cache_dir: if set, the compiled tagger/verbalizer are loaded from
+                (or written to) this directory instead of being rebuilt
+            overwrite_cache: if True, rebuild and overwrite the cached fsts
         """
         super().__init__("date", ordertype="en_tn")
         self.deterministic = deterministic
-        self.build_tagger()
-        self.build_verbalizer()
+        # without a cache dir, the tagger and verbalizer are built lazily on
+        # first access, see the properties below
+        if cache_dir is not None:
+            prefix = "en_date_deterministic" if deterministic else "en_date"
+            self.build_fst(prefix, cache_dir, overwrite_cache)
+
+    @property
+    def tagger(self):
+        if self._tagger is None:
+            self.build_tagger()
+        return self._tagger
+
+    @tagger.setter
+    def tagger(self, tagger):
+        self._tagger = tagger
+
+    @property
+    def verbalizer(self):
+        if self._verbalizer is None:
+            self.build_verbalizer()
+        return self._verbalizer
+
+    @verbalizer.setter
+    def verbalizer(self, verbalizer):
+        self._verbalizer = verbalizer
 
     def build_tagger(self):
         """
@@ -225,7 +306,7 @@ class Date(Processor):
             2012/01/05 -> date { year: "twenty twelve" month: "january" day: "five" }
             2012 -> date { year: "twenty twelve" }
         """
-        cardinal = Cardinal(self.deterministic)
+        cardinal = _get_cardinal(self.deterministic)
         # january, January, JANUARY
         month_graph = pynini.string_file(
             get_abs_path("english/data/date/month_name.tsv")
@@ -237,23 +318,22 @@ class Date(Processor):
         month_graph |= month_abbr_graph
         month_graph += pynutil.delete(self.PUNCT).ques
 
-        month_numbers_labels = pynini.string_file(
-            get_abs_path("english/data/date/month_number.tsv")
-        )
+        month_numbers_tsv = get_abs_path("english/data/date/month_number.tsv")
+        month_numbers_labels = pynini.string_file(month_numbers_tsv)
         cardinal_graph = cardinal.graph_hundred_component_at_least_one_none_zero_digit
 
-        year_graph = _get_year_graph(
-            cardinal_graph=cardinal_graph, deterministic=self.deterministic
-        )
-
-        # three_digit_year = (self.DIGIT @ cardinal_graph) + self.INSERT_SPACE + (self.DIGIT ** 2) @ cardinal_graph
-        # year_graph |= three_digit_year
+        # copy the memoized graph so build_tagger can never modify it in place
+        year_graph = _get_year_graph(self.deterministic).copy()
 
         month_graph = pynutil.insert('month: "') + month_graph + pynutil.insert('"')
         month_numbers_graph = (
             pynutil.insert('month: "') + month_numbers_labels + pynutil.insert('"')
         )
 
+        # small optional pieces shared by the graphs below
+        delete_zero = pynutil.delete("0").ques.optimize()
+        optional_punct = pynini.union(",", ".").ques.optimize()
+
         endings = ["rd", "th", "st", "nd"]
         endings += [x.upper() for x in endings]
         endings = pynini.union(*endings)
@@ -280,7 +360,7 @@ class Date(Processor):
         two_digit_year = (
             pynutil.insert('year: "')
             + two_digit_year
-            + pynini.union(",", ".").ques
+            + optional_punct
             + pynutil.insert('"')
         )
 
@@ -288,7 +368,7 @@ class Date(Processor):
             pynutil.insert(' year: "')
             + pynutil.delete(" ")
             + year_graph
-            + pynini.union(",", ".").ques
+            + optional_punct
             + pynutil.insert('"')
         )
         graph_year |= (
@@ -296,10 +376,18 @@ class Date(Processor):
             + pynini.accep(",")
             + pynini.accep(" ").ques
             + year_graph
-            + pynini.union(",", ".").ques
+            + optional_punct
             + pynutil.insert('"')
         )
         optional_graph_year = graph_year.ques
+        # jan-5-2012
+        dash_graph_year = (
+            pynutil.insert(' year: "')
+            + pynutil.delete("-")
+            + year_graph
+            + optional_punct
+            + pynutil.insert('"')
+        )
 
         year_graph = pynutil.insert('year: "') + year_graph + pynutil.insert('"')
 
@@ -310,23 +398,25 @@ class Date(Processor):
             | (self.DELETE_EXTRA_SPACE + day_graph + graph_year)
         )
         graph_mdy |= (
-            month_graph
-            + pynini.cross("-", " ")
-            + day_graph
-            + ((pynini.cross("-", " ") + self.VCHAR.star) @ graph_year).ques
+            month_graph + pynini.cross("-", " ") + day_graph + dash_graph_year.ques
         )
-        for x in ["-", "/", "."]:
-            delete_sep = pynutil.delete(x)
-            graph_mdy |= (
-                month_numbers_graph
-                + delete_sep
+        # both separators around the day have to be the same
+        day_with_sep = pynini.union(
+            *[
+                pynutil.delete(x)
                 + self.INSERT_SPACE
-                + pynutil.delete("0").ques
+                + delete_zero
                 + day_graph
-                + delete_sep
-                + self.INSERT_SPACE
-                + (pynutil.add_weight(year_graph, -1.0))
-            )
+                + pynutil.delete(x)
+                for x in ["-", "/", "."]
+            ]
+        )
+        graph_mdy |= (
+            month_numbers_graph
+            + day_with_sep
+            + self.INSERT_SPACE
+            + pynutil.add_weight(year_graph, -1.0)
+        )
 
         graph_dmy = (
             day_graph
@@ -335,20 +425,27 @@ class Date(Processor):
             + month_graph
             + optional_graph_year
         )
-        day_ex_month = (
-            self.DIGIT**2 - pynini.project(month_numbers_graph, "input")
-        ) @ day_graph
-        for x in ["-", "/", "."]:
-            delete_sep = pynutil.delete(x)
-            graph_dmy |= (
-                day_ex_month
-                + delete_sep
+        # two digit days that can not be read as a month, i.e. 13 - 31
+        month_numbers = {x[0] for x in load_labels(month_numbers_tsv)}
+        days_ex_month = [f"{x:02d}" for x in range(1, 32)]
+        days_ex_month = [x for x in days_ex_month if x not in month_numbers]
+        day_ex_month = pynini.string_map(days_ex_month).optimize() @ day_graph
+        # both separators around the month have to be the same
+        month_numbers_with_sep = pynini.union(
+            *[
+                pynutil.delete(x)
                 + self.INSERT_SPACE
                 + month_numbers_graph
-                + delete_sep
-                + self.INSERT_SPACE
-                + (pynutil.add_weight(year_graph, -1.0))
-            )
+                + pynutil.delete(x)
+                for x in ["-", "/", "."]
+            ]
+        )
+        graph_dmy |= (
+            day_ex_month
+            + month_numbers_with_sep
+            + self.INSERT_SPACE
+            + pynutil.add_weight(year_graph, -1.0)
+        )
 
         graph_ymd = (
             year_graph
@@ -359,18 +456,13 @@ class Date(Processor):
             + self.INSERT_SPACE
             + day_graph
         )
-        for x in ["-", "/", "."]:
-            delete_sep = pynutil.delete(x)
-            graph_ymd |= (
-                (pynutil.add_weight(year_graph, -1.0))
-                + delete_sep
-                + self.INSERT_SPACE
-                + month_numbers_graph
-                + delete_sep
-                + self.INSERT_SPACE
-                + pynutil.delete("0").ques
-                + day_graph
-            )
+        graph_ymd |= (
+            pynutil.add_weight(year_graph, -1.0)
+            + month_numbers_with_sep
+            + self.INSERT_SPACE
+            + delete_zero
+            + day_graph
+        )
 
         final_graph = (
             pynutil.add_weight(graph_mdy | graph_dmy | graph_ymd, -0.1) | year_graph
@@ -393,7 +485,7 @@ class Date(Processor):
             date { month: "february" day: "five" year: "twenty twelve" } -> the fifth of february twenty twelve
             date { day: "five" month: "february" year: "twenty twelve" } -> the fifth of february twenty twelve
         """
-        ordinal = Ordinal(self.deterministic)
+        ordinal = _get_ordinal(self.deterministic)
         phrase = self.NOT_QUOTE.plus
         day_cardinal = (
             pynutil.delete("day:")
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pynini
 import pytest
 
 from tn.english.rules.date import Date
@@ -26,3 +27,23 @@ class TestDate:
     @pytest.mark.parametrize("written, spoken", date_cases)
     def test_date(self, written, spoken):
         assert self.date.normalize(written) == spoken
+
+    def test_date_empty(self):
+        assert (pynini.accep("") @ self.date.tagger).num_states() == 0
+
+    def test_date_cache(self, tmp_path, monkeypatch):
+        Date(deterministic=False, cache_dir=tmp_path)
+        assert (tmp_path / "en_date_tagger.fst").exists()
+        assert (tmp_path / "en_date_verbalizer.fst").exists()
+
+        # the second instance must be read from disk, not rebuilt
+        def build(_):
+            raise AssertionError("fst rebuilt instead of loaded from cache")
+
+        monkeypatch.setattr(Date, "build_tagger", build)
+        monkeypatch.setattr(Date, "build_verbalizer", build)
+        date = Date(deterministic=False, cache_dir=tmp_path)
+        cases = list(parse_test_case("data/date.txt"))
+        assert len(cases) > 0
+        for written, spoken in cases:
+            assert date.normalize(written) == spoken